@@ -1,3 +1,4 @@
 from .cube import HoloCube                              # noqa (API import)
 from .geo import (GeoElement, GeoFeature, GeoTiles,     # noqa (API import)
                   WMTS, Points, Image, Text, Contours)
+from .tiles import CachedTiles                          # noqa (API import)
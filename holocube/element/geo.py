@@ -9,6 +9,46 @@ from holoviews.core import util
 from holoviews.element import Text as HVText
 
 from .cube import HoloCube
+from .tiles import CachedTiles
+
+
+def _crs_from_cube(cube):
+    coord_sys = cube.coord_system()
+    if hasattr(coord_sys, 'as_cartopy_projection'):
+        return coord_sys.as_cartopy_projection()
+
+
+def _crs_from_attr(obj):
+    return obj.crs
+
+
+# Maps data types to functions extracting their coordinate system
+_crs_extractors = {iris.cube.Cube: _crs_from_cube,
+                   Feature: _crs_from_attr,
+                   GoogleTiles: _crs_from_attr}
+
+# Caches the extractor resolved for each concrete data type
+_extractor_cache = {}
+
+
+def _get_crs_extractor(cls):
+    """
+    Looks up the function used to infer the coordinate reference
+    system of the supplied data type, walking the MRO so that
+    subclasses (e.g. specific tile sources) resolve to the
+    extractor of their registered base class.
+    """
+    try:
+        return _extractor_cache[cls]
+    except KeyError:
+        pass
+    extractor = None
+    for base in cls.__mro__:
+        if base in _crs_extractors:
+            extractor = _crs_extractors[base]
+            break
+    _extractor_cache[cls] = extractor
+    return extractor
 
 
 class GeoElement(Element2D):
@@ -25,14 +65,9 @@ class GeoElement(Element2D):
         when GeoElement wraps Iris Feature object.""")
     
     def __init__(self, data, **kwargs):
-        crs = None
         crs_data = data.data if isinstance(data, HoloCube) else data
-        if isinstance(crs_data, iris.cube.Cube):
-            coord_sys = crs_data.coord_system()
-            if hasattr(coord_sys, 'as_cartopy_projection'):
-                crs = coord_sys.as_cartopy_projection()
-        elif isinstance(crs_data, (Feature, GoogleTiles)):
-            crs = crs_data.crs
+        extractor = _get_crs_extractor(type(crs_data))
+        crs = extractor(crs_data) if extractor else None
 
         supplied_crs = kwargs.get('crs', None)
         if supplied_crs and crs and crs != supplied_crs:
@@ -93,12 +128,20 @@ class GeoTiles(GeoElement):
 
     group = param.String(default='GeoTiles')
 
+    cache_path = param.String(default=None, allow_None=True, doc="""
+        Path to an SQLite database used to cache downloaded tiles
+        between sessions. When set, the tile source is wrapped in a
+        CachedTiles instance.""")
+
     _auxiliary_component = True
 
     def __init__(self, data, **params):
         if not isinstance(data, GoogleTiles):
             raise TypeError('%s data has to be a cartopy GoogleTiles type'
                             % type(data).__name__)
+        cache_path = params.get('cache_path', self.cache_path)
+        if cache_path and not isinstance(data, CachedTiles):
+            data = CachedTiles(data, cache_path)
         super(GeoTiles, self).__init__(data, **params)
 
 
@@ -145,3 +188,20 @@ class Text(HVText, GeoElement):
     An annotation containing some text at an x, y coordinate
     along with a coordinate reference system.
     """
+
+    def __init__(self, *args, **params):
+        super(Text, self).__init__(*args, **params)
+        self._projected = {}
+
+    def project(self, projection):
+        """
+        Returns the x, y coordinate of the annotation transformed
+        into the supplied projection, caching the result since the
+        coordinate and crs of the annotation are fixed.
+        """
+        cached = self._projected.get(id(projection))
+        if cached is None or cached[0] is not projection:
+            x, y = self.data[:2]
+            point = projection.transform_point(x, y, src_crs=self.crs)
+            cached = self._projected[id(projection)] = (projection, point)
+        return cached[1]
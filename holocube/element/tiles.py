@@ -0,0 +1,136 @@
+import io
+import os
+import sqlite3
+import threading
+from multiprocessing.pool import ThreadPool
+
+from PIL import Image
+from cartopy.io.img_tiles import GoogleTiles
+
+# Number of concurrent tile downloads when prefetching, kept low
+# to respect the rate limits of public tile servers.
+PREFETCH_THREADS = 8
+
+_tile_pool = None
+
+
+class CachedTiles(GoogleTiles):
+    """
+    CachedTiles wraps a cartopy GoogleTiles tile source and keeps
+    every tile it fetches in an on-disk SQLite database, so that
+    tiles loaded in previous sessions are read from disk instead
+    of being downloaded again. The database uses the MBTiles
+    column layout extended with a tileset column holding the
+    tile URL of each source, allowing multiple tile sources to
+    share a single cache file.
+    """
+
+    def __init__(self, tiles, cache_path):
+        self.tiles = tiles
+        self._cache_file = cache_path
+        self._connect()
+
+    def _connect(self):
+        self._tileset = self._tileset_key(self.tiles)
+        self._lock = threading.Lock()
+        path = os.path.expanduser(self._cache_file)
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        self._db.execute('PRAGMA journal_mode=WAL')
+        self._db.execute('CREATE TABLE IF NOT EXISTS tiles '
+                         '(tileset TEXT, zoom_level INTEGER, '
+                         'tile_column INTEGER, tile_row INTEGER, '
+                         'tile_data BLOB, PRIMARY KEY (tileset, zoom_level, '
+                         'tile_column, tile_row))')
+        self._db.commit()
+
+    @staticmethod
+    def _tileset_key(tiles):
+        # Identify the tile source by the URL of its root tile, which
+        # resolves the server and style of the source.
+        try:
+            return tiles._image_url((0, 0, 0))
+        except NotImplementedError:
+            return getattr(tiles, 'url', None) or type(tiles).__name__
+
+    def __getattr__(self, attr):
+        # Delegate attributes such as crs and desired_tile_form
+        # to the wrapped tile source.
+        if attr == 'tiles':
+            raise AttributeError(attr)
+        return getattr(self.tiles, attr)
+
+    def __getstate__(self):
+        return {'tiles': self.tiles, '_cache_file': self._cache_file}
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._connect()
+
+    def _tile_key(self, tile):
+        # MBTiles stores rows in TMS order, flipped relative to
+        # the XYZ scheme used by cartopy.
+        x, y, z = tile
+        return (self._tileset, z, x, 2**z - 1 - y)
+
+    def find_images(self, *args, **kwargs):
+        return self.tiles.find_images(*args, **kwargs)
+
+    def tileextent(self, tile):
+        return self.tiles.tileextent(tile)
+
+    def cached(self, tile):
+        """
+        Returns whether the supplied tile is already in the cache.
+        """
+        with self._lock:
+            row = self._db.execute('SELECT 1 FROM tiles WHERE tileset=? AND '
+                                   'zoom_level=? AND tile_column=? AND '
+                                   'tile_row=?', self._tile_key(tile)).fetchone()
+        return row is not None
+
+    def prefetch(self, target_domain, target_z):
+        """
+        Concurrently downloads all uncached tiles covering the
+        target domain at the given zoom level, so that rendering
+        the domain afterwards only reads tiles from the cache.
+        """
+        global _tile_pool
+        missing = [tile for tile in self.find_images(target_domain, target_z)
+                   if isinstance(tile, tuple) and not self.cached(tile)]
+        if len(missing) < 2:
+            return
+        if _tile_pool is None:
+            _tile_pool = ThreadPool(PREFETCH_THREADS)
+        _tile_pool.map(self._prefetch_tile, missing)
+
+    def _prefetch_tile(self, tile):
+        # Failed downloads are skipped, as in image_for_domain
+        try:
+            self.get_image(tile)
+        except IOError:
+            pass
+
+    def get_image(self, tile):
+        if not isinstance(tile, tuple):
+            # Quadtree keys cannot be stored in the MBTiles layout
+            return self.tiles.get_image(tile)
+
+        key = self._tile_key(tile)
+        with self._lock:
+            row = self._db.execute('SELECT tile_data FROM tiles WHERE '
+                                   'tileset=? AND zoom_level=? AND '
+                                   'tile_column=? AND tile_row=?',
+                                   key).fetchone()
+        if row is not None:
+            img = Image.open(io.BytesIO(bytes(row[0])))
+            img = img.convert(self.desired_tile_form)
+            return img, self.tileextent(tile), 'lower'
+
+        img, extent, origin = self.tiles.get_image(tile)
+        buf = io.BytesIO()
+        img.save(buf, format='PNG')
+        with self._lock:
+            self._db.execute('INSERT OR REPLACE INTO tiles VALUES (?, ?, ?, ?, ?)',
+                             key + (sqlite3.Binary(buf.getvalue()),))
+            self._db.commit()
+        return img, extent, origin
@@ -1,7 +1,6 @@
 import copy
 
 import param
-import iris.plot as iplt
 from cartopy import crs as ccrs
 from holoviews.core import (Store, HoloMap, Layout, Overlay,
                             CompositeOverlay, Element)
@@ -11,7 +10,7 @@ from holoviews.plotting.mpl import (ElementPlot, ColorbarPlot, PointPlot,
                                     OverlayPlot as HvOverlayPlot)
 
 from ..element import (Contours, Image, Points, GeoFeature,
-                       WMTS, GeoTiles, Text, util)
+                       WMTS, GeoTiles, CachedTiles, Text, util)
 
 
 def _get_projection(el):
@@ -23,6 +22,21 @@ def _get_projection(el):
     return (int(el._auxiliary_component), el.crs) if hasattr(el, 'crs') else None
 
 
+def _shallow_copy(cube):
+    """
+    Copy the cube metadata and coordinates, which iris.plot may
+    modify when plotting, passing in the core data of the cube
+    rather than deep copying it. A lazy payload therefore stays
+    lazy on the original cube and is only realized on the copy,
+    while a realized payload is reused without copying.
+    """
+    if hasattr(cube, 'core_data'):
+        data = cube.core_data()
+    else:
+        data = cube.lazy_data() if cube.has_lazy_data() else cube.data
+    return cube.copy(data=data)
+
+
 class ProjectionPlot(object):
     """
     Implements custom _get_projection method to make the coordinate
@@ -105,7 +119,7 @@ class GeoContourPlot(GeoPlot, ColorbarPlot):
     style_opts = ['antialiased', 'alpha', 'cmap']
     
     def get_data(self, element, ranges, style):
-        args = (element.data.copy(),)
+        args = (_shallow_copy(element.data),)
         if isinstance(self.levels, int):
             args += (self.levels,)
         else:
@@ -113,6 +127,7 @@ class GeoContourPlot(GeoPlot, ColorbarPlot):
         return args, style, {}
 
     def init_artists(self, ax, plot_args, plot_kwargs):
+        import iris.plot as iplt
         plotfn = iplt.contourf if self.filled else iplt.contour
         artists = {'artist': plotfn(*plot_args, axes=ax, **plot_kwargs)}
         return artists
@@ -141,9 +156,10 @@ class GeoImagePlot(GeoPlot, ColorbarPlot):
     def get_data(self, element, ranges, style):
         self._norm_kwargs(element, ranges, style, element.vdims[0])
         style.pop('interpolation')
-        return (element.data.copy(),), style, {}
+        return (_shallow_copy(element.data),), style, {}
 
     def init_artists(self, ax, plot_args, plot_kwargs):
+        import iris.plot as iplt
         return {'artist': iplt.pcolormesh(*plot_args, axes=ax, **plot_kwargs)}
 
 
@@ -216,6 +232,11 @@ class GeoTilePlot(GeoPlot):
         return (element.data, self.zoom), style, {}
 
     def init_artists(self, ax, plot_args, plot_kwargs):
+        tiles, zoom = plot_args[:2]
+        if isinstance(tiles, CachedTiles):
+            # Download the visible tiles concurrently, cartopy
+            # then loads them serially from the warm cache.
+            tiles.prefetch(ax._get_extent_geom(tiles.crs), zoom)
         return {'artist': ax.add_image(*plot_args, **plot_kwargs)}
 
 
@@ -231,7 +252,7 @@ class GeoAnnotationPlot(AnnotationPlot):
         ranges = util.match_spec(annotation, ranges)
         axis = self.handles['axis']
         opts = self.style[self.cyclic_index]
-        handles = self.draw_annotation(axis, annotation.data, annotation.crs, opts)
+        handles = self.draw_annotation(axis, annotation, opts)
         self.handles['annotations'] = handles
         return self._finalize_axis(key, ranges=ranges)
 
@@ -240,19 +261,18 @@ class GeoAnnotationPlot(AnnotationPlot):
         for element in self.handles['annotations']:
             element.remove()
 
-        self.handles['annotations'] = self.draw_annotation(axis,
-                                                           annotation.data,
-                                                           annotation.crs, style)
+        self.handles['annotations'] = self.draw_annotation(axis, annotation,
+                                                           style)
 
 
 class GeoTextPlot(GeoAnnotationPlot, TextPlot):
     "Draw the Text annotation object"
 
-    def draw_annotation(self, axis, data, crs, opts):
-        (x,y, text, fontsize,
-         horizontalalignment, verticalalignment, rotation) = data
+    def draw_annotation(self, axis, annotation, opts):
+        (_, _, text, fontsize,
+         horizontalalignment, verticalalignment, rotation) = annotation.data
         opts['fontsize'] = fontsize
-        x, y = axis.projection.transform_point(x, y, src_crs=crs)
+        x, y = annotation.project(axis.projection)
         return [axis.text(x, y, text,
                           horizontalalignment=horizontalalignment,
                           verticalalignment=verticalalignment,
@@ -272,6 +292,5 @@ Store.register({Contours: GeoContourPlot,
                 Overlay: OverlayPlot}, 'matplotlib')
 
 
-# Define plot and style options
-opts = Store.options(backend='matplotlib')
+# Define plot options
 OverlayPlot.aspect = 'equal'
@@ -0,0 +1,27 @@
+from cartopy import crs as ccrs
+from holocube.element import Text
+from holoviews.element.comparison import ComparisonTestCase
+
+
+class CountingMercator(ccrs.Mercator):
+    """
+    Mercator projection recording the number of point transforms.
+    """
+
+    calls = 0
+
+    def transform_point(self, x, y, src_crs, *args, **kwargs):
+        self.calls += 1
+        return super(CountingMercator, self).transform_point(x, y, src_crs,
+                                                             *args, **kwargs)
+
+
+class TestText(ComparisonTestCase):
+
+    def test_text_project_cached(self):
+        proj = CountingMercator()
+        text = Text(10, 20, 'a', crs=ccrs.PlateCarree())
+        expected = ccrs.Mercator().transform_point(10, 20, ccrs.PlateCarree())
+        self.assertEqual(text.project(proj), expected)
+        self.assertEqual(text.project(proj), expected)
+        self.assertEqual(proj.calls, 1)
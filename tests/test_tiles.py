@@ -0,0 +1,83 @@
+import os
+import shutil
+import tempfile
+
+from PIL import Image
+from shapely.geometry import box
+from cartopy.io.img_tiles import GoogleTiles
+from holocube.element import CachedTiles, GeoTiles
+from holoviews.element.comparison import ComparisonTestCase
+
+
+class CountingTiles(GoogleTiles):
+    """
+    Tile source generating solid color tiles which records
+    each tile it is asked to fetch.
+    """
+
+    def __init__(self):
+        super(CountingTiles, self).__init__()
+        self.fetched = []
+
+    def get_image(self, tile):
+        self.fetched.append(tile)
+        img = Image.new('RGB', (4, 4), tuple(tile))
+        return img, self.tileextent(tile), 'lower'
+
+
+class OtherTiles(CountingTiles):
+    """
+    Tile source served from a different URL than CountingTiles.
+    """
+
+    def _image_url(self, tile):
+        return 'https://tiles.example.com/%s/%s/%s.png' % tile[::-1]
+
+
+class TestCachedTiles(ComparisonTestCase):
+
+    def setUp(self):
+        self.tempdir = tempfile.mkdtemp()
+        self.cache_path = os.path.join(self.tempdir, 'tiles.mbtiles')
+        self.tiles = CountingTiles()
+
+    def tearDown(self):
+        shutil.rmtree(self.tempdir)
+
+    def test_cached_tiles_fetches_once(self):
+        cached = CachedTiles(self.tiles, self.cache_path)
+        cached.get_image((1, 2, 3))
+        cached.get_image((1, 2, 3))
+        self.assertEqual(self.tiles.fetched, [(1, 2, 3)])
+
+    def test_cached_tiles_persist_between_instances(self):
+        CachedTiles(self.tiles, self.cache_path).get_image((1, 2, 3))
+        img, _, origin = CachedTiles(self.tiles, self.cache_path).get_image((1, 2, 3))
+        self.assertEqual(self.tiles.fetched, [(1, 2, 3)])
+        self.assertEqual(img.getpixel((0, 0)), (1, 2, 3))
+        self.assertEqual(origin, 'lower')
+
+    def test_cached_tiles_separate_tile_servers(self):
+        other = OtherTiles()
+        CachedTiles(self.tiles, self.cache_path).get_image((1, 2, 3))
+        CachedTiles(other, self.cache_path).get_image((1, 2, 3))
+        self.assertEqual(self.tiles.fetched, [(1, 2, 3)])
+        self.assertEqual(other.fetched, [(1, 2, 3)])
+
+    def test_cached_tiles_delegates_crs(self):
+        cached = CachedTiles(self.tiles, self.cache_path)
+        self.assertEqual(cached.crs, self.tiles.crs)
+
+    def test_geotiles_wraps_tiles_with_cache_path(self):
+        tiles = GeoTiles(self.tiles, cache_path=self.cache_path)
+        self.assertIsInstance(tiles.data, CachedTiles)
+        self.assertIs(tiles.data.tiles, self.tiles)
+
+    def test_cached_tiles_prefetch(self):
+        cached = CachedTiles(self.tiles, self.cache_path)
+        domain = box(-1e6, -1e6, 1e6, 1e6)
+        expected = sorted(self.tiles.find_images(domain, 2))
+        cached.prefetch(domain, 2)
+        self.assertEqual(sorted(self.tiles.fetched), expected)
+        cached.image_for_domain(domain, 2)
+        self.assertEqual(len(self.tiles.fetched), len(expected))